@@ -6,7 +6,7 @@ import sys
 
 def main():
     """Run administrative tasks."""
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'qna_project.settings')
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'qna_project.settings.prod')
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
@@ -0,0 +1,10 @@
+"""
+Settings profiles for qna_project project.
+
+    qna_project.settings.prod   full application on PostgreSQL (default)
+    qna_project.settings.api    API-only runtime: no admin/sessions/messages
+    qna_project.settings.test   in-memory SQLite for the pytest suite
+    qna_project.settings.bench  API-only runtime on SQLite for benchmark runs
+
+Select a profile with the DJANGO_SETTINGS_MODULE environment variable.
+"""
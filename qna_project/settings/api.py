@@ -0,0 +1,50 @@
+"""
+API-only runtime settings for qna_project project.
+
+Drops the applications and middleware the JSON API never uses (admin,
+sessions, messages, staticfiles, CSRF, clickjacking) to reduce the attack
+surface: the admin site is not routed and no session cookies are issued.
+This is not a startup optimisation; cold start is the same as prod within
+run-to-run noise (see scripts/measure_startup.py).
+"""
+
+from .prod import *  # noqa: F401,F403
+
+INSTALLED_APPS = [
+    'django.contrib.contenttypes',
+
+    'rest_framework',
+
+    'questions'
+]
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'django.middleware.common.CommonMiddleware',
+]
+
+ROOT_URLCONF = 'qna_project.urls_api'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.request',
+            ],
+        },
+    },
+]
+
+# Without django.contrib.auth the anonymous DRF user is None; the browsable
+# API needs staticfiles, so only JSON is rendered.
+REST_FRAMEWORK = {
+    'DEFAULT_AUTHENTICATION_CLASSES': [],
+    'DEFAULT_PERMISSION_CLASSES': [],
+    'DEFAULT_RENDERER_CLASSES': [
+        'rest_framework.renderers.JSONRenderer',
+    ],
+    'UNAUTHENTICATED_USER': None,
+}
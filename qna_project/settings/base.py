@@ -1,8 +1,11 @@
 """
-Django settings for qna_project project.
+Base Django settings for qna_project project.
 
 Generated by 'django-admin startproject' using Django 5.2.8.
 
+Shared by every profile in this package; profiles (prod, api, test, bench)
+import everything from here and override what they need.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/topics/settings/
 
@@ -11,11 +14,11 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 from pathlib import Path
+import copy
 import os
-from dotenv import load_dotenv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
-BASE_DIR = Path(__file__).resolve().parent.parent
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
 
 # Quick-start development settings - unsuitable for production
@@ -77,18 +80,7 @@ WSGI_APPLICATION = 'qna_project.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
-load_dotenv()
-
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.postgresql',
-        'NAME': os.getenv('DB_NAME', 'qna_db'),
-        'USER': os.getenv('DB_USER', 'qna_user'),
-        'PASSWORD': os.getenv('DB_PASSWORD', 'qna_password'),
-        'HOST': os.getenv('DB_HOST', 'localhost'),
-        'PORT': os.getenv('DB_PORT', '5432'),
-    }
-}
+# Defined per profile: prod.py (PostgreSQL), test.py and bench.py (SQLite).
 
 
 # Password validation
@@ -127,6 +119,17 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# HTTP caching of API reads (questions/caching.py)
+# Policy name -> keyword arguments for django.utils.cache.patch_cache_control().
+# By default shared caches may store responses but must revalidate them;
+# revalidation is answered with 304 without serializing the resource.
+
+API_CACHE_CONTROL = {
+    'question_list': {'public': True, 'max_age': 0, 'must_revalidate': True},
+    'question_detail': {'public': True, 'max_age': 0, 'must_revalidate': True},
+    'answer_detail': {'public': True, 'max_age': 0, 'must_revalidate': True},
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -169,3 +172,15 @@ LOGGING = {
         },
     },
 }
+
+
+def without_file_logging(logging_config):
+    """
+    Return a copy of logging_config without the 'file' handler and with the
+    'questions' logger reduced to WARNING on the console, so that logs/ does
+    not have to exist and per-request INFO logging stays out of the way.
+    """
+    logging_config = copy.deepcopy(logging_config)
+    logging_config['handlers'].pop('file')
+    logging_config['loggers']['questions'].update(handlers=['console'], level='WARNING')
+    return logging_config
@@ -0,0 +1,22 @@
+"""
+Benchmark settings for qna_project project.
+
+API-only runtime (see api.py) on a local SQLite file, with DEBUG and
+per-request INFO logging turned off so they do not skew measurements.
+"""
+
+from .api import *  # noqa: F401,F403
+from .base import without_file_logging
+
+DEBUG = False
+
+ALLOWED_HOSTS = ['*']
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.getenv('BENCH_DB_NAME', BASE_DIR / 'bench.sqlite3'),
+    }
+}
+
+LOGGING = without_file_logging(LOGGING)
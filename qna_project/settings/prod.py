@@ -0,0 +1,23 @@
+"""
+Production settings for qna_project project.
+
+Full set of applications (admin, sessions, messages) on PostgreSQL.
+Connection parameters are read from the environment / .env file.
+"""
+
+from dotenv import load_dotenv
+
+from .base import *  # noqa: F401,F403
+
+load_dotenv()
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.getenv('DB_NAME', 'qna_db'),
+        'USER': os.getenv('DB_USER', 'qna_user'),
+        'PASSWORD': os.getenv('DB_PASSWORD', 'qna_password'),
+        'HOST': os.getenv('DB_HOST', 'localhost'),
+        'PORT': os.getenv('DB_PORT', '5432'),
+    }
+}
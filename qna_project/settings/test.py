@@ -0,0 +1,22 @@
+"""
+Test settings for qna_project project.
+
+In-memory SQLite: no PostgreSQL server is needed and each pytest-xdist
+worker process gets its own private database (`pytest -n auto`).
+"""
+
+from .base import *  # noqa: F401,F403
+from .base import without_file_logging
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+LOGGING = without_file_logging(LOGGING)
@@ -0,0 +1,6 @@
+from django.urls import path, include
+
+urlpatterns = [
+    path('api/', include('questions.api_urls')),  # API
+    path('', include('questions.urls')),         # Главная страница
+]
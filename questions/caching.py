@@ -0,0 +1,139 @@
+from functools import wraps
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
+
+from .models import Question, Answer
+
+
+def _media_suffix(request) -> str:
+    """
+    Формат, выбранный DRF при согласовании контента (json, api, ...).
+
+    Входит в ETag, чтобы разные представления одного ресурса не считались равными.
+    """
+    renderer = getattr(request, 'accepted_renderer', None)
+    return getattr(renderer, 'format', '') or ''
+
+
+def _memoize(request, key: str, func):
+    """
+    Вычисляет `func()` один раз за запрос: `condition` может вызывать функции
+    ETag и Last-Modified по отдельности, а данные им нужны одни и те же.
+    """
+    cache = request.__dict__.setdefault('_validator_state', {})
+    if key not in cache:
+        cache[key] = func()
+    return cache[key]
+
+
+def _question_list_state(request) -> dict:
+    """
+    Возвращает агрегаты, от которых зависит список вопросов: количество и
+    время последнего изменения вопросов и ответов (два запроса без сериализации).
+    """
+    def compute():
+        state = Question.objects.aggregate(questions=Count('id'), questions_last=Max('updated_at'))
+        state.update(Answer.objects.aggregate(answers=Count('id'), answers_last=Max('created_at')))
+        return state
+    return _memoize(request, 'question_list', compute)
+
+
+def _first_or_none(build_queryset):
+    """
+    Строит queryset и возвращает его первую строку или None, в том числе для
+    некорректного pk из URL (например, 'abc'): тогда view сама вернёт обычный 404.
+    """
+    try:
+        return build_queryset().first()
+    except (ValueError, TypeError, ValidationError):
+        return None
+
+
+def _question_detail_state(request, pk):
+    """
+    Возвращает агрегаты для одного вопроса и его ответов или None, если вопрос не найден.
+    """
+    return _memoize(request, f'question_{pk}', lambda: _first_or_none(lambda: (
+        Question.objects.filter(pk=pk)
+        .annotate(answers_count=Count('answers'), answers_last=Max('answers__created_at'))
+        .values('updated_at', 'answers_count', 'answers_last')
+    )))
+
+
+def _answer_created_at(request, pk):
+    return _memoize(request, f'answer_{pk}', lambda: _first_or_none(lambda: (
+        Answer.objects.filter(pk=pk).values_list('created_at', flat=True)
+    )))
+
+
+# Список и вопрос с ответами проверяются только по ETag: MAX(...) по времени
+# уменьшается при удалении самой новой строки и имеет точность HTTP-даты в
+# одну секунду, поэтому Last-Modified для них дал бы ложный 304. ETag включает
+# количество строк и микросекунды. Ответы не редактируются — для них
+# Last-Modified (created_at) безопасен.
+
+def question_list_etag(request, *args, **kwargs):
+    state = _question_list_state(request)
+    return '-'.join([
+        'ql',
+        str(state['questions']),
+        str(state['questions_last'] and state['questions_last'].timestamp()),
+        str(state['answers']),
+        str(state['answers_last'] and state['answers_last'].timestamp()),
+        _media_suffix(request),
+    ])
+
+
+def question_detail_etag(request, pk=None, *args, **kwargs):
+    state = _question_detail_state(request, pk)
+    if state is None:
+        return None
+    return '-'.join([
+        f'q{pk}',
+        str(state['updated_at'].timestamp()),
+        str(state['answers_count']),
+        str(state['answers_last'] and state['answers_last'].timestamp()),
+        _media_suffix(request),
+    ])
+
+
+def answer_detail_etag(request, pk=None, *args, **kwargs):
+    created_at = _answer_created_at(request, pk)
+    if created_at is None:
+        return None
+    return f'a{pk}-{created_at.timestamp()}-{_media_suffix(request)}'
+
+
+def answer_detail_last_modified(request, pk=None, *args, **kwargs):
+    return _answer_created_at(request, pk)
+
+
+def conditional_get(policy: str, etag_func, last_modified_func=None):
+    """
+    Декоратор для чтения ресурсов API с поддержкой условных GET-запросов.
+
+    Поведение:
+        - До вызова view (и сериализации) вычисляет валидаторы `etag_func`
+          и (если задан) `last_modified_func` через `django.views.decorators.http.condition`.
+        - Если ресурс не изменился (`If-None-Match` / `If-Modified-Since`),
+          сразу возвращает 304 Not Modified.
+        - Добавляет к ответам GET/HEAD заголовок `Cache-Control` согласно
+          политике `policy` из настройки `API_CACHE_CONTROL` и `Vary: Accept`.
+
+    """
+    def decorator(view_func):
+        conditional_view = condition(etag_func=etag_func, last_modified_func=last_modified_func)(view_func)
+
+        @wraps(view_func)
+        def inner(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            if request.method in ('GET', 'HEAD'):
+                patch_cache_control(response, **settings.API_CACHE_CONTROL.get(policy, {}))
+                patch_vary_headers(response, ['Accept'])
+            return response
+        return inner
+    return decorator
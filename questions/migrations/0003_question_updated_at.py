@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 17:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questions', '0002_alter_answer_text_alter_question_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
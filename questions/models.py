@@ -11,6 +11,8 @@ class Question(models.Model):
         text (TextField): Текст вопроса. Не может быть пустым; проверяется
             через MinLengthValidator(1).
         created_at (DateTimeField): Дата и время создания вопроса (устанавливается автоматически).
+        updated_at (DateTimeField): Дата и время последнего изменения вопроса (обновляется
+            автоматически при каждом сохранении; используется для HTTP-валидаторов).
 
     Методы:
         __str__(): Возвращает строковое представление вопроса в формате
@@ -21,6 +23,7 @@ class Question(models.Model):
         blank=False
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"Q#{self.pk}: {self.text[:50]}"
@@ -1,5 +1,7 @@
 import pytest
+import time
 import uuid
+from django.utils.http import http_date
 from rest_framework.test import APIClient
 from questions.models import Question, Answer
 
@@ -41,4 +43,90 @@ def test_delete_answer_api():
     url = f"/api/answers/{a.id}/"
     response = client.delete(url)
     assert response.status_code == 204
-    assert not Answer.objects.filter(id=a.id).exists()
\ No newline at end of file
+    assert not Answer.objects.filter(id=a.id).exists()
+
+@pytest.mark.django_db
+def test_question_list_conditional_get():
+    client = APIClient()
+    Question.objects.create(text="Вопрос")
+    url = "/api/questions/"
+    response = client.get(url)
+    assert response.status_code == 200
+    assert "max-age=0" in response["Cache-Control"]
+    etag = response["ETag"]
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert "max-age=0" in response["Cache-Control"]
+    Question.objects.create(text="Новый вопрос")
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+@pytest.mark.django_db
+def test_question_detail_conditional_get():
+    client = APIClient()
+    q = Question.objects.create(text="Вопрос")
+    url = f"/api/questions/{q.id}/"
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response["ETag"]
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+    Answer.objects.create(question=q, user_id=uuid.uuid4(), text="Ответ")
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert len(response.data["answers"]) == 1
+    etag = response["ETag"]
+    client.patch(url, {"text": "Изменённый вопрос"}, format="json")
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data["text"] == "Изменённый вопрос"
+
+@pytest.mark.django_db
+def test_answer_detail_conditional_get():
+    client = APIClient()
+    q = Question.objects.create(text="Вопрос")
+    a = Answer.objects.create(question=q, user_id=uuid.uuid4(), text="Ответ")
+    url = f"/api/answers/{a.id}/"
+    response = client.get(url)
+    assert response.status_code == 200
+    assert client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 304
+    assert client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]).status_code == 304
+    assert client.get("/api/answers/999999/").status_code == 404
+
+
+@pytest.mark.django_db
+def test_question_list_revalidation_after_delete():
+    client = APIClient()
+    Question.objects.create(text="Старый вопрос")
+    newest = Question.objects.create(text="Новый вопрос")
+    url = "/api/questions/"
+    response = client.get(url)
+    assert "Last-Modified" not in response
+    since = http_date(time.time() + 60)
+    newest.delete()
+    response = client.get(url, HTTP_IF_MODIFIED_SINCE=since)
+    assert response.status_code == 200
+    assert len(response.data) == 1
+
+@pytest.mark.django_db
+def test_question_detail_revalidation_after_answer_delete():
+    client = APIClient()
+    q = Question.objects.create(text="Вопрос")
+    a = Answer.objects.create(question=q, user_id=uuid.uuid4(), text="Ответ")
+    url = f"/api/questions/{q.id}/"
+    response = client.get(url)
+    assert "Last-Modified" not in response
+    etag = response["ETag"]
+    since = http_date(time.time() + 60)
+    a.delete()
+    response = client.get(url, HTTP_IF_MODIFIED_SINCE=since)
+    assert response.status_code == 200
+    assert response.data["answers"] == []
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_question_detail_non_numeric_id():
+    client = APIClient()
+    response = client.get("/api/questions/abc/")
+    assert response.status_code == 404
@@ -4,10 +4,24 @@ from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from rest_framework.decorators import api_view
 from django.shortcuts import render
+from django.utils.decorators import method_decorator
 from .models import Question, Answer
 from .serializers import QuestionSerializer, AnswerSerializer
 from.services import create_question, delete_question, create_answer, delete_answer
-
+from .caching import (
+    conditional_get,
+    question_list_etag, question_detail_etag,
+    answer_detail_etag, answer_detail_last_modified,
+)
+
+@method_decorator(
+    conditional_get('question_list', question_list_etag),
+    name='list',
+)
+@method_decorator(
+    conditional_get('question_detail', question_detail_etag),
+    name='retrieve',
+)
 class QuestionViewSet(viewsets.ModelViewSet):
     """
     ViewSet для модели Question.
@@ -15,6 +29,8 @@ class QuestionViewSet(viewsets.ModelViewSet):
     Назначение:
         Предоставляет стандартные CRUD-операции через REST API для объектов Question:
         list, retrieve, create, update, partial_update, destroy.
+        list и retrieve поддерживают условные GET-запросы по ETag (304) и отдают
+        заголовок Cache-Control (см. `questions.caching`).
 
     Методы:
         create(self, request, *args, **kwargs): Создание вопроса с логгированием
@@ -71,12 +87,14 @@ class AnswerViewSet(viewsets.GenericViewSet):
         получение одного объекта (retrieve) и удаление (destroy).
 
     Методы:
-        retrieve(request, pk): Возвращает сериализованные данные ответа. Статус HTTP 200 при успехе, 404 если не найден.
+        retrieve(request, pk): Возвращает сериализованные данные ответа. Статус HTTP 200 при успехе, 404 если не найден,
+            304 если ответ не изменился (ETag / Last-Modified).
         destroy(request, pk): Удаляет ответ. Статус HTTP 204 при успешном удалении, 404 если не найден.
     """
     queryset = Answer.objects.all()
     serializer_class = AnswerSerializer
 
+    @method_decorator(conditional_get('answer_detail', answer_detail_etag, answer_detail_last_modified))
     def retrieve(self, request, pk=None):
         """
         Получает объект Answer по его PK и возвращает сериализованные данные через API. При обращении логирует получение.
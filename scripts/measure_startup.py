@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Measure cold start of the settings profiles.
+
+Every run starts a fresh interpreter that times django.setup() (imports and
+app loading) and then the first Client().get(path) request. min/median/max
+over the runs are printed, since single runs vary by tens of milliseconds.
+
+The default path, the API root /api/, does not open a database connection or
+touch a viewset, so it only measures URL/DRF loading; it needs no PostgreSQL
+server (the prod profile only needs psycopg2 to be importable). To measure a
+real endpoint, point the profile at a migrated database, e.g.:
+
+    python manage.py migrate --settings=qna_project.settings.bench
+    python scripts/measure_startup.py --path /api/questions/ bench
+
+logs/ is created because the prod and api profiles log to logs/app.log.
+
+Usage:
+    python scripts/measure_startup.py [--runs N] [--path PATH] [profile ...]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+DEFAULT_PROFILES = ['prod', 'api', 'bench']
+
+CHILD = '''
+import sys
+import time
+t0 = time.perf_counter()
+import django
+django.setup()
+t1 = time.perf_counter()
+from django.conf import settings
+from django.test import Client
+client = Client(HTTP_HOST='localhost')
+t2 = time.perf_counter()
+response = client.get(sys.argv[1])
+t3 = time.perf_counter()
+assert response.status_code == 200, response.status_code
+print((t1 - t0) * 1000, (t3 - t2) * 1000, len(settings.INSTALLED_APPS))
+'''
+
+
+def measure(profile: str, path: str) -> tuple[float, float, int]:
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=f'qna_project.settings.{profile}')
+    result = subprocess.run(
+        [sys.executable, '-c', CHILD, path],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True,
+    )
+    if result.returncode:
+        sys.exit(f'{profile}: measurement failed\n{result.stderr}')
+    output = result.stdout.split()
+    return float(output[0]), float(output[1]), int(output[2])
+
+
+def spread(values: list[float]) -> str:
+    return f'{min(values):.0f}/{statistics.median(values):.0f}/{max(values):.0f}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('profiles', nargs='*', default=DEFAULT_PROFILES)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--path', default='/api/')
+    args = parser.parse_args()
+    (BASE_DIR / 'logs').mkdir(exist_ok=True)
+
+    print(f'GET {args.path}, {args.runs} runs, min / median / max in ms')
+    print(f'{"profile":<8} {"setup":>15} {"first request":>15} {"total":>15} {"apps":>5}')
+    for profile in args.profiles:
+        runs = [measure(profile, args.path) for _ in range(args.runs)]
+        columns = [
+            spread([run[0] for run in runs]),
+            spread([run[1] for run in runs]),
+            spread([run[0] + run[1] for run in runs]),
+        ]
+        print(f'{profile:<8} {columns[0]:>15} {columns[1]:>15} {columns[2]:>15} {runs[0][2]:>5}')
+
+
+if __name__ == '__main__':
+    main()